@@ -1,122 +1,381 @@
 #!/usr/bin/env python3
 
+import asyncio
+import atexit
+import itertools
+import json
 import logging
 import multiprocessing
+import queue
 import random
+import re
+import socket
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from playwright.sync_api import sync_playwright, Page, Browser
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator, List, Optional, Tuple
+
+import httpx
+from playwright.async_api import async_playwright, Page, Browser
+from playwright.sync_api import sync_playwright
+
+# Upper bound on concurrently open browser contexts, across all processes
+DEFAULT_CONCURRENCY = 50
+# Submissions each browser context handles per batch handed to a process
+SUBMISSIONS_PER_CONTEXT = 5
+# Upper bound on concurrent HTTP submissions when posting directly
+DEFAULT_HTTP_CONCURRENCY = 200
+
+# Form definition Google embeds in every viewform page
+FB_PUBLIC_LOAD_DATA_RE = re.compile(
+    r"FB_PUBLIC_LOAD_DATA_\s*=\s*(.*?);\s*</script>", re.DOTALL
+)
+# Question types answered with one radio choice per row: multiple choice,
+# linear scale and multiple-choice grid (one row per entry ID)
+SINGLE_CHOICE_QUESTION_TYPES = frozenset({2, 5, 7})
+PAGE_BREAK_QUESTION_TYPE = 8
+
+RADIO_GROUP_SELECTOR = "div[role='radiogroup']"
+RADIO_OPTION_SELECTOR = "div[role='radio']"
+CHECKED_OPTION_SELECTOR = (
+    "div[role='radiogroup'] div[role='radio'][aria-checked='true']"
+)
+OTHER_OPTION_VALUE = "__other_option__"
+
+# Nothing is rendered for a human, so skip downloading purely visual assets.
+# Chromium drops these itself (Network.setBlockedURLs), so no request is paused
+# waiting on Python as it would be with routing and the HTTP cache stays on.
+# The cost is that Network.enable has Playwright forward every Network event
+# to the worker process.
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.png?*",
+    "*.jpg",
+    "*.jpg?*",
+    "*.jpeg",
+    "*.jpeg?*",
+    "*.gif",
+    "*.gif?*",
+    "*.webp",
+    "*.webp?*",
+    "*.svg",
+    "*.svg?*",
+    "*.ico",
+    "*.ico?*",
+    "*.woff",
+    "*.woff?*",
+    "*.woff2",
+    "*.woff2?*",
+    "*.ttf",
+    "*.ttf?*",
+    "*.css",
+    "*.css?*",
+    "*://www.gstatic.com/_/*/_/ss/*",  # Google's bundled stylesheets
+    "*://fonts.googleapis.com/*",
+    "*://fonts.gstatic.com/*",
+    "*://*.googleusercontent.com/*",  # Header images and uploaded pictures
+]
+CONTEXT_VIEWPORT = {"width": 800, "height": 600}
+
+# Collects the data-value of every option, grouped per question
+EXTRACT_OPTIONS_JS = """([groupSelector, optionSelector]) =>
+    [...document.querySelectorAll(groupSelector)].map((group) =>
+        [...group.querySelectorAll(optionSelector)].map((option) =>
+            option.getAttribute("data-value")
+        )
+    )"""
+
+# Clicks the chosen option index of every question; null skips a question
+SELECT_OPTIONS_JS = """([groupSelector, optionSelector, choices]) => {
+    const groups = document.querySelectorAll(groupSelector);
+    choices.forEach((choice, i) => {
+        if (choice !== null) {
+            groups[i].querySelectorAll(optionSelector)[choice].click();
+        }
+    });
+}"""
+
+# True once the page has registered a checked option for every answer
+ANSWERS_REGISTERED_JS = """([checkedSelector, expected]) =>
+    document.querySelectorAll(checkedSelector).length >= expected"""
 
 
 class FormFiller:
-    def __init__(self, form_url: str, submission_count: int):
+    def __init__(self, form_url: str, submission_count: int, browser: Browser):
         self.form_url = form_url
         self.submission_count = submission_count
+        self.browser = browser
         self.successful_submissions = 0
         self.failed_submissions = 0
-        self.setup_browser()
+        self.context = None
+        self._closed = False
+        # Private generator, seeded from os.urandom, so workers share no state
+        self._rng = random.Random()
 
-    def setup_browser(self):
-        """Initialize Playwright browser with appropriate options."""
-        self.playwright = sync_playwright().start()
-        self.browser: Browser = self.playwright.chromium.launch(headless=False)
-        self.context = self.browser.new_context()
-        self.page: Page = self.context.new_page()
-        self.page.set_default_timeout(10000)
+    async def __aenter__(self):
+        return await self.open()
 
-    def fill_form(self) -> bool:
+    async def open(self):
+        """Set up the context and page, closing them again if setup fails."""
+        try:
+            await self.setup_browser()
+        except BaseException:
+            # Don't leak a half-configured context if setup fails midway
+            await self.cleanup()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.cleanup()
+
+    async def setup_browser(self):
+        """Open an isolated context and page on the shared browser."""
+        self.context = await self.browser.new_context(viewport=CONTEXT_VIEWPORT)
+        self.context.set_default_timeout(10000)
+        self.page: Page = await self.context.new_page()
+
+        # The page is reused for every submission, so blocking once is enough
+        cdp_session = await self.context.new_cdp_session(self.page)
+        await cdp_session.send("Network.enable")
+        await cdp_session.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+    async def fill_form(self) -> bool:
         """Fill a single form with random choices."""
         try:
-            self.page.goto(self.form_url)
-
-            questions = self.page.locator("div[role='radiogroup']").all()
-
-            for question in questions:
-                options = question.locator("div[role='radio']").all()
-                if options:
-                    filtered_options = [
-                        option
-                        for option in options
-                        if option.get_attribute("data-value") != "__other_option__"
-                    ]
-                    chosen_option = (
-                        random.choice(filtered_options)
-                        if filtered_options
-                        else random.choice(options)
-                    )
-                    chosen_option.scroll_into_view_if_needed()
-                    chosen_option.click()
-                    time.sleep(0.1)
-
+            await self.page.goto(self.form_url)
+
+            # One round-trip to read the whole form and one to answer it
+            questions = await self.page.evaluate(
+                EXTRACT_OPTIONS_JS, [RADIO_GROUP_SELECTOR, RADIO_OPTION_SELECTOR]
+            )
+            choices = [self._choose_option(values) for values in questions]
+            await self.page.evaluate(
+                SELECT_OPTIONS_JS,
+                [RADIO_GROUP_SELECTOR, RADIO_OPTION_SELECTOR, choices],
+            )
+
+            # Let the form's scripts register every click before submitting
+            answered = sum(choice is not None for choice in choices)
+            await self.page.wait_for_function(
+                ANSWERS_REGISTERED_JS, arg=[CHECKED_OPTION_SELECTOR, answered]
+            )
+
+            # The button's jsaction handles synthetic clicks, so skip the
+            # scroll/visibility/stability checks that locator.click() performs
             submit_button = self.page.locator("div[role='button'][jsname='M2UYVd']")
-            submit_button.click()
+            await submit_button.dispatch_event("click")
 
-            self.page.wait_for_url("**/formResponse*")
+            await self.page.wait_for_url("**/formResponse*")
             return True
 
         except Exception as e:
-            logging.error(f"Error filling form: {str(e)}")
+            logging.error("Error filling form: %s", e)
             return False
 
-    def run(self):
-        """Run a single form submission."""
-        success = self.fill_form()
+    def _choose_option(self, option_values: list):
+        """Pick a random option index, avoiding "Other" when possible."""
+        if not option_values:
+            return None
+        filtered_indices = [
+            index
+            for index, value in enumerate(option_values)
+            if value != OTHER_OPTION_VALUE
+        ]
+        return (
+            self._rng.choice(filtered_indices)
+            if filtered_indices
+            else self._rng.randrange(len(option_values))
+        )
+
+    async def run(self):
+        """Run a single form submission on the reused page."""
+        # Fresh cookies per submission so responses can't be linked together;
+        # fill_form's goto replaces the previous document, unloading it
+        await self.context.clear_cookies()
+        success = await self.fill_form()
         if success:
             self.successful_submissions += 1
         else:
             self.failed_submissions += 1
-        self.cleanup()
         return success
 
     def log_summary(self, duration: float):
         """Log the summary of the form filling process."""
         logging.info(
-            f"""
+            """
 Form submission completed:
-- Total submissions attempted: {self.submission_count}
-- Successful submissions: {self.successful_submissions}
-- Failed submissions: {self.failed_submissions}
-- Time taken: {duration:.2f} seconds
-- Average rate: {self.successful_submissions / duration:.2f} submissions/second
-"""
+- Total submissions attempted: %d
+- Successful submissions: %d
+- Failed submissions: %d
+- Time taken: %.2f seconds
+- Average rate: %.2f submissions/second
+""",
+            self.submission_count,
+            self.successful_submissions,
+            self.failed_submissions,
+            duration,
+            self.successful_submissions / duration,
         )
 
-    def cleanup(self):
-        """Clean up resources."""
+    async def cleanup(self):
+        """Clean up resources. Safe to call more than once."""
+        if self._closed or self.context is None:
+            return
+        self._closed = True
         try:
-            self.context.close()
-            self.browser.close()
-            self.playwright.stop()
+            # The browser is shared across submissions, so only the context goes
+            await self.context.close()
         except Exception as e:
-            logging.error(f"Error during cleanup: {str(e)}")
+            logging.error("Error during cleanup: %s", e)
+
 
+def setup_logging(background: bool = True):
+    """Set up logging configuration.
 
-def setup_logging():
-    """Set up logging configuration."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    By default records are queued and written to stderr by a listener thread,
+    so workers never block on the stream lock or the write syscall.
+    """
+    formatter = logging.Formatter(
+        "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
     )
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    if not background:
+        logging.basicConfig(level=logging.INFO, handlers=[stream_handler])
+        return
+
+    # QueueHandler.prepare() still interpolates each message on the logging
+    # thread; the listener thread adds the timestamp/level and does the write.
+    # The handler is attached directly because basicConfig would give it
+    # BASIC_FORMAT and prefix every message twice.
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+async def submission_worker(
+    form_filler: FormFiller, submissions: Iterator[int], on_result
+):
+    """Worker coroutine that runs submissions on one long-lived FormFiller."""
+    # The iterator is shared, so workers keep pulling until it runs dry
+    for _ in submissions:
+        form_filler.submission_count += 1
+        try:
+            success = await form_filler.run()
+        except Exception as e:
+            logging.error("Worker error: %s", e)
+            success = False
+        on_result(success)
 
 
-def submission_worker(form_url: str) -> bool:
-    """Worker function for handling a single form submission in a separate thread."""
-    try:
-        form_filler = FormFiller(form_url, submission_count=1)
-        return form_filler.run()
-    except Exception as e:
-        logging.error(f"Worker thread error: {str(e)}")
-        return False
+async def run_submission_batch(form_fillers: List[FormFiller], batch_size: int) -> int:
+    """Run a batch of submissions concurrently and return how many succeeded."""
+    successful_submissions = 0
+
+    def record_result(success: bool):
+        nonlocal successful_submissions
+        successful_submissions += success
+
+    submissions = iter(range(batch_size))
+    await asyncio.gather(
+        *(
+            submission_worker(form_filler, submissions, record_result)
+            for form_filler in form_fillers[:batch_size]
+        )
+    )
+    return successful_submissions
 
 
-def run_threaded_submissions(
-    form_url: str, submission_count: int, max_workers: int = None
+async def open_form_fillers(
+    form_url: str, browser: Browser, count: int, exit_stack: AsyncExitStack
+) -> List[FormFiller]:
+    """Open up to count FormFillers on exit_stack, skipping any whose setup fails."""
+
+    async def open_form_filler():
+        try:
+            return await exit_stack.enter_async_context(
+                FormFiller(form_url, submission_count=0, browser=browser)
+            )
+        except Exception as e:
+            logging.error("Worker setup error: %s", e)
+            return None
+
+    form_fillers = await asyncio.gather(*(open_form_filler() for _ in range(count)))
+    return [form_filler for form_filler in form_fillers if form_filler is not None]
+
+
+# Per-process event loop, browser connection and FormFillers, set up once by
+# _init_worker so contexts and pages outlive individual batches, and released
+# by _shutdown_worker when the process exits by closing their exit stack
+_worker_loop = None
+_worker_exit_stack = AsyncExitStack()
+_worker_playwright = None
+_worker_browser = None
+_worker_fillers = []
+
+
+def _init_worker(cdp_endpoint: str, form_url: str, concurrency: int):
+    """Connect this worker process to the shared browser and open its contexts."""
+    global _worker_loop, _worker_playwright, _worker_browser, _worker_fillers
+    # Workers only log the occasional error while the parent logs progress, so
+    # a listener thread per process would buy nothing; log synchronously here
+    setup_logging(background=False)
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    atexit.register(_shutdown_worker)
+    _worker_playwright = _worker_loop.run_until_complete(async_playwright().start())
+    _worker_browser = _worker_loop.run_until_complete(
+        _worker_playwright.chromium.connect_over_cdp(cdp_endpoint)
+    )
+    _worker_fillers = _worker_loop.run_until_complete(
+        open_form_fillers(form_url, _worker_browser, concurrency, _worker_exit_stack)
+    )
+
+
+def _shutdown_worker():
+    """Close this worker process's contexts and stop its Playwright driver."""
+    _worker_loop.run_until_complete(_worker_exit_stack.aclose())
+    if _worker_playwright is not None:
+        _worker_loop.run_until_complete(_worker_playwright.stop())
+
+
+def batch_worker(batch_size: int) -> int:
+    """Worker function for running a batch of submissions in a separate process."""
+    return _worker_loop.run_until_complete(
+        run_submission_batch(_worker_fillers, batch_size)
+    )
+
+
+def launch_shared_browser(playwright) -> tuple:
+    """Launch a single headless Chromium that all workers connect to over CDP."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    browser = playwright.chromium.launch(
+        headless=True, args=[f"--remote-debugging-port={port}"]
+    )
+    return browser, f"http://127.0.0.1:{port}"
+
+
+def run_submissions(
+    form_url: str,
+    submission_count: int,
+    max_workers: int = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ):
-    """Run form submissions using multiple threads."""
+    """Run form submissions across a pool of processes sharing one browser."""
     successful_submissions = 0
-    failed_submissions = 0
+    completed_submissions = 0
     start_time = time.time()
 
     # Use CPU count for optimal number of workers
@@ -124,50 +383,260 @@ def run_threaded_submissions(
     usable_cpu_count = max(cpu_count // 2, 1)  # Use only half of the available cores
     if max_workers is None:
         max_workers = min(usable_cpu_count, submission_count)
+    # Never open more contexts in a process than it has submissions to run
+    process_share = -(-submission_count // max_workers)
+    process_concurrency = max(min(concurrency // max_workers, process_share), 1)
 
     logging.info(
-        f"Starting {submission_count} threaded submissions with {max_workers} workers "
-        f"(System has {cpu_count} CPU cores)"
+        "Starting %d submissions with %d worker processes, %d browser contexts "
+        "each (System has %d CPU cores)",
+        submission_count,
+        max_workers,
+        process_concurrency,
+        cpu_count,
     )
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks and store futures
-        futures = [
-            executor.submit(submission_worker, form_url)
-            for _ in range(submission_count)
-        ]
+    # Each batch lets every context in a process handle a few submissions
+    batch_size = process_concurrency * SUBMISSIONS_PER_CONTEXT
+    batch_sizes = (
+        min(batch_size, submission_count - start)
+        for start in range(0, submission_count, batch_size)
+    )
 
-        # Process completed futures as they finish
-        for i, future in enumerate(as_completed(futures), 1):
-            try:
-                if future.result():
-                    successful_submissions += 1
-                else:
-                    failed_submissions += 1
-
-                # Log progress every 5 submissions
-                if i % 5 == 0:
-                    current_rate = i / (time.time() - start_time)
+    # Launch Chromium once; every worker process connects to it over CDP
+    with sync_playwright() as playwright:
+        browser, cdp_endpoint = launch_shared_browser(playwright)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(cdp_endpoint, form_url, process_concurrency),
+            ) as executor:
+                # Keep a couple of batches queued per process instead of
+                # creating every future upfront; refill as batches finish
+                in_flight = {}
+                for size in itertools.islice(batch_sizes, 2 * max_workers):
+                    future = executor.submit(batch_worker, size)
+                    in_flight[future] = size
+
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        completed_submissions += in_flight.pop(future)
+                        try:
+                            successful_submissions += future.result()
+                        except Exception as e:
+                            logging.error("Worker process error: %s", e)
+
+                        next_size = next(batch_sizes, None)
+                        if next_size is not None:
+                            next_future = executor.submit(batch_worker, next_size)
+                            in_flight[next_future] = next_size
+
+                    current_rate = completed_submissions / (time.time() - start_time)
                     logging.info(
-                        f"Completed {i}/{submission_count} submissions. "
-                        f"Current rate: {current_rate:.2f}/sec"
+                        "Completed %d/%d submissions. Current rate: %.2f/sec",
+                        completed_submissions,
+                        submission_count,
+                        current_rate,
                     )
 
-            except Exception as e:
-                failed_submissions += 1
-                logging.error(f"Future error: {str(e)}")
+        finally:
+            browser.close()
+
+    failed_submissions = submission_count - successful_submissions
 
     # Log final summary
     duration = time.time() - start_time
     logging.info(
-        f"""
-Thread pool submission completed:
-- Total submissions attempted: {submission_count}
-- Successful submissions: {successful_submissions}
-- Failed submissions: {failed_submissions}
-- Time taken: {duration:.2f} seconds
-- Average rate: {successful_submissions / duration:.2f} submissions/second
-"""
+        """
+Process pool submission completed:
+- Total submissions attempted: %d
+- Successful submissions: %d
+- Failed submissions: %d
+- Time taken: %.2f seconds
+- Average rate: %.2f submissions/second
+""",
+        submission_count,
+        successful_submissions,
+        failed_submissions,
+        duration,
+        successful_submissions / duration,
+    )
+
+
+class UnanswerableFormError(Exception):
+    """Raised when a form has a required question no submission path can answer."""
+
+
+@dataclass
+class FormSchema:
+    """Entry IDs and option values needed to post responses directly."""
+
+    response_url: str
+    fields: List[Tuple[int, List[str]]]
+    page_count: int = 1
+
+    def random_payload(self, rng: random.Random) -> dict:
+        """Build form data picking a random option for every question."""
+        payload = {
+            f"entry.{entry_id}": rng.choice(options)
+            for entry_id, options in self.fields
+        }
+        payload["fvv"] = "1"
+        payload["pageHistory"] = ",".join(str(i) for i in range(self.page_count))
+        return payload
+
+
+def fetch_form_schema(form_url: str) -> Optional[FormSchema]:
+    """Read the form definition once so responses can be posted without a browser.
+
+    Returns None when the page has no usable definition, in which case the
+    caller falls back to the browser. Raises UnanswerableFormError for a
+    required question that is not single choice, since neither path can fill
+    it in. HTTP errors (e.g. a 404 for a wrong URL) are raised.
+    """
+    response = httpx.get(form_url, follow_redirects=True, timeout=10)
+    response.raise_for_status()
+
+    match = FB_PUBLIC_LOAD_DATA_RE.search(response.text)
+    if not match:
+        return None
+
+    try:
+        questions = json.loads(match.group(1))[1][1] or []
+    except (ValueError, IndexError, TypeError):
+        return None
+
+    fields = []
+    page_count = 1
+    for question in questions:
+        question_type = question[3]
+        if question_type == PAGE_BREAK_QUESTION_TYPE:
+            page_count += 1
+        rows = question[4] if len(question) > 4 else None
+        if not rows:
+            continue
+
+        # Grids have one row per entry ID; other questions have a single row
+        for row in rows:
+            entry_id, raw_options = row[0], row[1] or []
+            required = len(row) > 2 and bool(row[2])
+            # The "Other" option has an empty value, so only use it as a last resort
+            options = [option[0] for option in raw_options if option[0]] or [
+                option[0] for option in raw_options
+            ]
+            if question_type in SINGLE_CHOICE_QUESTION_TYPES and options:
+                fields.append((entry_id, options))
+            elif required:
+                # Posting without this answer would be rejected every time
+                raise UnanswerableFormError(
+                    f"Required question {question[1]!r} is not single choice"
+                )
+
+    if not fields:
+        return None
+
+    response_url = re.sub(r"/viewform.*$", "/formResponse", str(response.url))
+    return FormSchema(response_url=response_url, fields=fields, page_count=page_count)
+
+
+async def http_submission_worker(
+    client: httpx.AsyncClient,
+    schema: FormSchema,
+    submissions: Iterator[int],
+    on_result,
+):
+    """Worker coroutine that posts responses straight to the formResponse endpoint."""
+    rng = random.Random()
+    for _ in submissions:
+        try:
+            response = await client.post(
+                schema.response_url, data=schema.random_payload(rng)
+            )
+            success = response.status_code == 200
+            if not success:
+                logging.error("Submission rejected with HTTP %d", response.status_code)
+        except httpx.HTTPError as e:
+            logging.error("Error posting form: %r", e)
+            success = False
+        on_result(success)
+
+
+async def post_submissions(
+    schema: FormSchema, submission_count: int, concurrency: int, on_result
+):
+    """Post all submissions over one pooled HTTP/2 client."""
+    limits = httpx.Limits(max_connections=concurrency)
+    # Refuse every cookie so responses can't be linked together
+    cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    async with httpx.AsyncClient(
+        http2=True, limits=limits, timeout=10, cookies=cookies
+    ) as client:
+        submissions = iter(range(submission_count))
+        await asyncio.gather(
+            *(
+                http_submission_worker(client, schema, submissions, on_result)
+                for _ in range(concurrency)
+            )
+        )
+
+
+def run_http_submissions(
+    schema: FormSchema,
+    submission_count: int,
+    concurrency: int = DEFAULT_HTTP_CONCURRENCY,
+):
+    """Run form submissions as direct HTTP posts, without a browser."""
+    successful_submissions = 0
+    failed_submissions = 0
+    start_time = time.time()
+
+    concurrency = min(concurrency, submission_count)
+
+    logging.info(
+        "Starting %d direct HTTP submissions with %d concurrent requests",
+        submission_count,
+        concurrency,
+    )
+
+    def record_result(success: bool):
+        nonlocal successful_submissions, failed_submissions
+        if success:
+            successful_submissions += 1
+        else:
+            failed_submissions += 1
+
+        # Log progress every 5 submissions
+        completed = successful_submissions + failed_submissions
+        if completed % 5 == 0:
+            current_rate = completed / (time.time() - start_time)
+            logging.info(
+                "Completed %d/%d submissions. Current rate: %.2f/sec",
+                completed,
+                submission_count,
+                current_rate,
+            )
+
+    asyncio.run(post_submissions(schema, submission_count, concurrency, record_result))
+
+    # Log final summary
+    duration = time.time() - start_time
+    logging.info(
+        """
+HTTP submission completed:
+- Total submissions attempted: %d
+- Successful submissions: %d
+- Failed submissions: %d
+- Time taken: %.2f seconds
+- Average rate: %.2f submissions/second
+""",
+        submission_count,
+        successful_submissions,
+        failed_submissions,
+        duration,
+        successful_submissions / duration,
     )
 
 
@@ -186,14 +655,20 @@ def main():
             print("Please enter a valid number.")
 
     try:
-        run_threaded_submissions(
-            form_url, submission_count
-        )  # max_workers will be auto-calculated
+        schema = fetch_form_schema(form_url)
+        if schema is not None:
+            run_http_submissions(schema, submission_count)
+        else:
+            logging.info("Could not read the form definition, using the browser")
+            run_submissions(form_url, submission_count)
+    except UnanswerableFormError as e:
+        logging.error("Cannot fill this form, nothing was submitted: %s", e)
+        sys.exit(1)
     except KeyboardInterrupt:
         logging.info("Operation interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Fatal error: {str(e)}")
+        logging.error("Fatal error: %s", e)
         sys.exit(1)
 
 